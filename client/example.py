@@ -1,35 +1,50 @@
 import asyncio
 import random
+import ssl
+import sys
 import achtung
 import strategy
 import game_client
 
+try:
+    import uvloop
+except ImportError:  # uvloop is not available on Windows
+    uvloop = None
+
+ACTIONS = tuple(achtung.GameAction)
+
 
 class RandomStrategy(strategy.Strategy):
     def take_action(self, _game_state: achtung.Achtung, player_id: achtung.PlayerId) -> achtung.GameAction | None:
-        action = random.choice(list(achtung.GameAction))
-        return action
+        return random.choice(ACTIONS)
 
 
-async def create_client(request_updates: bool):
+async def create_client(request_updates: bool, ssl_context: ssl.SSLContext):
     strat = RandomStrategy()
     client = await game_client.GameClient(
         game_state_type=achtung.Achtung,
         game_strategy=strat,
         request_updates=request_updates,
-    ).connect("achtung.fly.dev", 443)
+    ).connect("achtung.fly.dev", 443, ssl_context)
     # ).connect("0.0.0.0", 3030)
     await client.run()
 
 
 async def run_clients() -> None:
-    # run multiple clients concurrently
+    if sys.version_info >= (3, 12):
+        # run new tasks eagerly up to their first real await instead of scheduling them
+        asyncio.get_running_loop().set_task_factory(asyncio.eager_task_factory)
+
+    # run multiple clients concurrently, sharing one TLS context between them
+    ssl_context = ssl.create_default_context()
     tasks = []
     for i in range(8):
-        tasks.append(asyncio.create_task(create_client(request_updates=i == 0)))
+        tasks.append(asyncio.create_task(create_client(request_updates=i == 0, ssl_context=ssl_context)))
 
     await asyncio.gather(*tasks)
 
 
 if __name__ == "__main__":
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
     asyncio.run(run_clients())
@@ -1,7 +1,8 @@
-import json
+import ssl
 from typing import Literal, TypeVar, Generic
 
 import attrs
+import orjson
 import strategy
 import websockets
 import cattrs
@@ -13,6 +14,9 @@ GameActionT = TypeVar("GameActionT")
 StateDiffT = TypeVar("StateDiffT")
 G = TypeVar("G", bound=game.GameState)
 
+# Server frames are trusted, so skip cattrs' per-field error collection on the hot path
+converter = cattrs.Converter(detailed_validation=False)
+
 
 @attrs.define
 class GameOver(Generic[PlayerIdT]):
@@ -41,11 +45,6 @@ class AssignPlayerId(Generic[PlayerIdT]):
 GameEventT = InitialState[G] | AssignPlayerId[PlayerIdT] | UpdateState[StateDiffT] | GameOver[PlayerIdT]
 
 
-@attrs.define
-class GameEvent(Generic[G, PlayerIdT, StateDiffT]):
-    event: GameEventT[G, PlayerIdT, StateDiffT]
-
-
 @attrs.define
 class ActionEvent(Generic[GameActionT]):
     action: GameActionT
@@ -65,35 +64,68 @@ class GameClient(Generic[G, PlayerIdT, GameActionT, StateDiffT]):
     game_strategy: strategy.Strategy = attrs.field()
     request_updates: bool = attrs.field(default=False)
     game_state_type: type[G] = attrs.field()
-
-    async def connect(self, host: str, port: int) -> "ConnectedGameClient[G, PlayerIdT, GameActionT, StateDiffT]":
-        connection = await websockets.connect(f"wss://{host}:{port}/join/player")
-        return ConnectedGameClient(connection=connection, **attrs.asdict(self))  # type: ignore
+    # Server events are tagged by their "e" field, so structure them as the concrete class directly
+    _game_event_types: dict[str, type[GameEventT[G, PlayerIdT, StateDiffT]]] = attrs.field(init=False)
+
+    @_game_event_types.default
+    def _parametrize_game_events(self) -> dict[str, type[GameEventT[G, PlayerIdT, StateDiffT]]]:
+        state_type = self.game_state_type
+        return {
+            "AssignPlayerId": AssignPlayerId[state_type.player_id_type],
+            "InitialState": InitialState[state_type],
+            "UpdateState": UpdateState[state_type.state_diff_type],
+            "GameOver": GameOver[state_type.player_id_type],
+        }
+
+    async def connect(
+        self, host: str, port: int, ssl_context: ssl.SSLContext | bool = True
+    ) -> "ConnectedGameClient[G, PlayerIdT, GameActionT, StateDiffT]":
+        connection = await websockets.connect(f"wss://{host}:{port}/join/player", ssl=ssl_context, compression=None)
+        return ConnectedGameClient(
+            connection=connection,
+            game_strategy=self.game_strategy,
+            request_updates=self.request_updates,
+            game_state_type=self.game_state_type,
+        )
 
     def serialize_player_event(self, event: PlayerEventT[GameActionT]) -> bytes:
-        return json.dumps(cattrs.unstructure(event)).encode("utf-8")
+        return orjson.dumps(converter.unstructure(event))
 
-    def deserialize_game_event(self, data: bytes) -> "GameEvent[G, PlayerIdT, StateDiffT]":
-        return cattrs.structure(
-            json.loads(data),
-            GameEvent[self.game_state_type, self.game_state_type.player_id_type, self.game_state_type.state_diff_type],
-        )
+    def deserialize_game_event(self, data: bytes | str) -> GameEventT[G, PlayerIdT, StateDiffT]:
+        event = orjson.loads(data)["event"]
+        event_type = self._game_event_types.get(event["e"])
+        if event_type is None:
+            raise ValueError(f"Unexpected event '{event['e']}'")
+        return converter.structure(event, event_type)
 
 
 @attrs.define(kw_only=True)
 class ConnectedGameClient(GameClient[G, PlayerIdT, GameActionT, StateDiffT]):
     _connection: websockets.WebSocketClientProtocol = attrs.field()
+    # Events sent every tick only take a handful of values, so encode each of them once
+    _action_payloads: dict[GameActionT, bytes] = attrs.field(init=False, factory=dict)
+    _request_update_payload: bytes = attrs.field(init=False)
 
-    async def send_event(self, player_event: PlayerEventT) -> None:
+    @_request_update_payload.default
+    def _serialize_request_update(self) -> bytes:
+        return self.serialize_player_event(RequestUpdateEvent())
+
+    async def send_payload(self, payload: bytes) -> None:
         if self._connection.open:
-            await self._connection.send(self.serialize_player_event(player_event))
+            await self._connection.send(payload)
+
+    async def send_event(self, player_event: PlayerEventT) -> None:
+        await self.send_payload(self.serialize_player_event(player_event))
+
+    async def send_action(self, action: GameActionT) -> None:
+        if (payload := self._action_payloads.get(action)) is None:
+            payload = self._action_payloads[action] = self.serialize_player_event(ActionEvent(action=action))
+        await self.send_payload(payload)
 
     async def receive_event(self) -> GameEventT[G, PlayerIdT, StateDiffT]:
         match await self._connection.recv():
-            case str(data):
-                return self.deserialize_game_event(data.encode("utf-8")).event
-            case bytes(data):
-                return self.deserialize_game_event(data).event
+            case str(data) | bytes(data):
+                return self.deserialize_game_event(data)
             case data:
                 raise ValueError(f"Unexpected type {type(data)}")
 
@@ -108,13 +140,13 @@ class ConnectedGameClient(GameClient[G, PlayerIdT, GameActionT, StateDiffT]):
 
         while True:
             if self.request_updates:
-                await self.send_event(RequestUpdateEvent())
+                await self.send_payload(self._request_update_payload)
             match await self.receive_event():
                 case UpdateState(diff=state_diff):
                     game_state.merge_with_diff(state_diff)
                     action = self.game_strategy.take_action(game_state, player_id)
                     if action is not None:
-                        await self.send_event(ActionEvent(action=action))
+                        await self.send_action(action)
                 case GameOver(winner=player_id):
                     game_state.game_over_callback(winner=player_id)
                     await self._connection.close()
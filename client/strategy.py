@@ -24,10 +24,12 @@ class SlowStrategy(Strategy[G, PlayerId, GameAction, StateDiff]):
     def __init__(self, strategy: Strategy[G, PlayerId, GameAction, StateDiff]) -> None:
         self.strategy = strategy
         self.action_job: Future[GameAction | None] | None = None
+        # Only one action is computed at a time, so a single worker is enough
+        self.executor = ThreadPoolExecutor(max_workers=1)
 
     def take_action(self, game_state: G, player_id: PlayerId) -> GameAction | None:
         if self.action_job is None:
-            self.action_job = ThreadPoolExecutor().submit(self.strategy.take_action, game_state, player_id)
+            self.action_job = self.executor.submit(self.strategy.take_action, game_state, player_id)
             return None
         elif self.action_job.done():
             action = self.action_job.result()